@@ -1,11 +1,8 @@
 """Database configuration and session management"""
-from sqlalchemy import create_engine
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
 import os
 from dotenv import load_dotenv
-from pathlib import Path
 
 load_dotenv()
 
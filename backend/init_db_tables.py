@@ -1,13 +1,11 @@
 """Initialize database tables and seed data"""
 import asyncio
 import sys
-import os
 from pathlib import Path
 
 # Add parent directory to path
 sys.path.insert(0, str(Path(__file__).parent))
 
-from sqlalchemy import select
 from database import engine, Base, AsyncSessionLocal
 from models import User, Plan, Subscription, UserRole, SubscriptionStatus
 from auth import get_password_hash
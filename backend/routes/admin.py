@@ -1,13 +1,13 @@
 """Superadmin routes"""
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, func, and_, extract
-from typing import List
+from typing import List, Optional
 import logging
 from datetime import datetime
 
 from database import get_db
-from models import User, Audit, Subscription, UserRole
+from models import User, Audit, AuditStatus, Subscription
 from schemas import (
     UserResponse, 
     UserUpdate, 
@@ -26,48 +26,48 @@ async def get_dashboard_stats(
     db: AsyncSession = Depends(get_db)
 ):
     """Get admin dashboard statistics"""
-    # Total users
-    result = await db.execute(select(func.count(User.id)))
-    total_users = result.scalar()
-    
-    # Active users (logged in last 30 days)
-    result = await db.execute(
-        select(func.count(User.id))
-        .where(User.is_active == True)
-    )
-    active_users = result.scalar()
-    
-    # Total audits
-    result = await db.execute(select(func.count(Audit.id)))
-    total_audits = result.scalar()
-    
-    # Audits this month
     current_month = datetime.now().month
     current_year = datetime.now().year
+    
+    # Fetch every counter in a single round-trip using scalar subqueries
     result = await db.execute(
-        select(func.count(Audit.id))
-        .where(
-            and_(
-                extract('month', Audit.created_at) == current_month,
-                extract('year', Audit.created_at) == current_year
+        select(
+            # Total users
+            select(func.count(User.id)).scalar_subquery(),
+            # Active users
+            select(func.count(User.id))
+            .where(User.is_active == True)
+            .scalar_subquery(),
+            # Total audits
+            select(func.count(Audit.id)).scalar_subquery(),
+            # Audits this month
+            select(func.count(Audit.id))
+            .where(
+                and_(
+                    extract('month', Audit.created_at) == current_month,
+                    extract('year', Audit.created_at) == current_year
+                )
             )
+            .scalar_subquery(),
+            # Active subscriptions
+            select(func.count(Subscription.id))
+            .where(Subscription.status == 'active')
+            .scalar_subquery(),
+            # Average audit score
+            select(func.avg(Audit.overall_score))
+            .where(Audit.overall_score.isnot(None))
+            .scalar_subquery()
         )
     )
-    audits_this_month = result.scalar()
-    
-    # Active subscriptions
-    result = await db.execute(
-        select(func.count(Subscription.id))
-        .where(Subscription.status == 'active')
-    )
-    active_subscriptions = result.scalar()
-    
-    # Average audit score
-    result = await db.execute(
-        select(func.avg(Audit.overall_score))
-        .where(Audit.overall_score.isnot(None))
-    )
-    avg_score = result.scalar() or 0.0
+    (
+        total_users,
+        active_users,
+        total_audits,
+        audits_this_month,
+        active_subscriptions,
+        avg_score
+    ) = result.one()
+    avg_score = avg_score or 0.0
     
     return AdminDashboardStats(
         total_users=total_users,
@@ -154,12 +154,20 @@ async def delete_user(
 async def get_all_audits(
     skip: int = 0,
     limit: int = 50,
+    website_url: Optional[str] = None,
+    audit_status: Optional[AuditStatus] = Query(None, alias="status"),
     current_user: User = Depends(get_current_superadmin),
     db: AsyncSession = Depends(get_db)
 ):
-    """Get all audits (superadmin only)"""
+    """Get all audits, optionally filtered by website and status (superadmin only)"""
+    query = select(Audit)
+    if website_url:
+        query = query.where(Audit.website_url == website_url)
+    if audit_status:
+        query = query.where(Audit.status == audit_status)
+    
     result = await db.execute(
-        select(Audit)
+        query
         .order_by(Audit.created_at.desc())
         .offset(skip)
         .limit(limit)
@@ -1,23 +1,30 @@
 """Audit routes"""
-from fastapi import APIRouter, Depends, HTTPException, BackgroundTasks, status
+from fastapi import APIRouter, Depends, HTTPException, BackgroundTasks, Query, status
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, and_, func, extract
-from typing import List
+from typing import List, Optional
 import logging
 import uuid
 from datetime import datetime, timezone
 import asyncio
+import time
 
 from database import get_db
 from models import User, Audit, AuditResult, AuditStatus, Subscription, CheckStatus
-from schemas import AuditCreate, AuditResponse, AuditDetailResponse, AuditResultResponse
+from schemas import AuditCreate, AuditResponse, AuditDetailResponse
 from auth import get_current_user
 from seo_engine import crawl_website, run_all_comprehensive_checks
-from seo_engine.orchestrator import SEOOrchestrator
 
 router = APIRouter(prefix="/audits", tags=["Audits"])
 logger = logging.getLogger(__name__)
 
+IN_PROGRESS_STATUSES = (
+    AuditStatus.PENDING,
+    AuditStatus.CRAWLING,
+    AuditStatus.ANALYZING,
+    AuditStatus.GENERATING_REPORT
+)
+
 
 async def process_audit(audit_id: str, website_url: str, max_pages: int):
     """Background task to process audit"""
@@ -35,15 +42,26 @@ async def process_audit(audit_id: str, website_url: str, max_pages: int):
             
             # Crawl website
             logger.info(f"Starting crawl for {website_url}")
+            crawl_started = time.monotonic()
             pages = await crawl_website(website_url, max_pages=max_pages)
-            
+            # Wall-clock crawl duration; per-page load times overlap within a batch
+            crawl_time = time.monotonic() - crawl_started
+
+            # Nothing to analyze - skip the check pipeline entirely
+            if not pages:
+                audit.status = AuditStatus.FAILED
+                audit.error_message = f"Could not crawl any pages from {website_url}"
+                await db.commit()
+                logger.warning(f"Audit {audit_id} failed: no pages crawled")
+                return
+
             audit.pages_crawled = len(pages)
             audit.status = AuditStatus.ANALYZING
             await db.commit()
             
             # Run SEO checks
             logger.info(f"Running SEO checks for audit {audit_id}")
-            check_results = run_all_comprehensive_checks(pages)
+            check_results = await asyncio.to_thread(run_all_comprehensive_checks, pages)
             
             # Save results
             passed = 0
@@ -52,13 +70,15 @@ async def process_audit(audit_id: str, website_url: str, max_pages: int):
             total_impact = 0
             
             for check_result in check_results:
+                check_status = CheckStatus(check_result.get('status', 'info'))
+                impact_score = check_result.get('impact_score', 50)
                 result_obj = AuditResult(
                     id=str(uuid.uuid4()),
                     audit_id=audit_id,
                     category=check_result.get('category', 'Unknown'),
                     check_name=check_result.get('check_name', ''),
-                    status=CheckStatus(check_result.get('status', 'info')),
-                    impact_score=check_result.get('impact_score', 50),
+                    status=check_status,
+                    impact_score=impact_score,
                     current_value=check_result.get('current_value', ''),
                     recommended_value=check_result.get('recommended_value', ''),
                     pros=check_result.get('pros', []),
@@ -71,14 +91,14 @@ async def process_audit(audit_id: str, website_url: str, max_pages: int):
                 db.add(result_obj)
                 
                 # Count statuses
-                if result_obj.status == CheckStatus.PASS:
+                if check_status == CheckStatus.PASS:
                     passed += 1
-                elif result_obj.status == CheckStatus.FAIL:
+                elif check_status == CheckStatus.FAIL:
                     failed += 1
-                    total_impact += result_obj.impact_score
-                elif result_obj.status == CheckStatus.WARNING:
+                    total_impact += impact_score
+                elif check_status == CheckStatus.WARNING:
                     warning += 1
-                    total_impact += result_obj.impact_score * 0.5
+                    total_impact += impact_score * 0.5
             
             # Calculate overall score (0-100)
             total_checks = len(check_results)
@@ -99,8 +119,8 @@ async def process_audit(audit_id: str, website_url: str, max_pages: int):
             audit.overall_score = round(overall_score, 1)
             audit.completed_at = datetime.now(timezone.utc)
             audit.audit_metadata = {
-                'crawl_time': sum(p.load_time for p in pages),
-                'avg_load_time': sum(p.load_time for p in pages) / len(pages) if pages else 0
+                'crawl_time': crawl_time,
+                'avg_load_time': sum(p.load_time for p in pages) / len(pages)
             }
             
             await db.commit()
@@ -246,13 +266,16 @@ async def get_audit_detail(
             detail="Not authorized to view this audit"
         )
     
-    # Get results
-    result = await db.execute(
-        select(AuditResult)
-        .where(AuditResult.audit_id == audit_id)
-        .order_by(AuditResult.impact_score.desc())
-    )
-    results = result.scalars().all()
+    # Get results (saved only when processing ends, so skip the query
+    # while an in-progress audit is being polled)
+    results = []
+    if audit.status not in IN_PROGRESS_STATUSES:
+        result = await db.execute(
+            select(AuditResult)
+            .where(AuditResult.audit_id == audit_id)
+            .order_by(AuditResult.impact_score.desc())
+        )
+        results = result.scalars().all()
     
     # Build response
     audit_dict = {
@@ -274,3 +297,47 @@ async def get_audit_detail(
     }
     
     return audit_dict
+
+
+@router.get("/{audit_id}/wait", response_model=AuditResponse)
+async def wait_for_audit(
+    audit_id: str,
+    current_status: Optional[AuditStatus] = Query(None, alias="status"),
+    timeout: int = Query(25, ge=1, le=60),
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db)
+):
+    """Long-poll until the audit leaves `status` (or finishes), up to `timeout` seconds"""
+    deadline = time.monotonic() + timeout
+    # Read these up front: the rollback between polls expires loaded objects
+    user_id = current_user.id
+    is_superadmin = current_user.role == 'superadmin'
+    
+    while True:
+        result = await db.execute(
+            select(Audit)
+            .where(Audit.id == audit_id)
+            .execution_options(populate_existing=True)
+        )
+        audit = result.scalar_one_or_none()
+        
+        if not audit:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Audit not found"
+            )
+        
+        # Check ownership (superadmins can see all)
+        if audit.user_id != user_id and not is_superadmin:
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail="Not authorized to view this audit"
+            )
+        
+        status_changed = current_status is not None and audit.status != current_status
+        if status_changed or audit.status not in IN_PROGRESS_STATUSES or time.monotonic() >= deadline:
+            return audit
+        
+        # End the read transaction so the background task can commit, then re-check
+        await db.rollback()
+        await asyncio.sleep(1)
@@ -7,7 +7,7 @@ import logging
 
 from database import get_db
 from models import User, UserRole, Plan, Subscription, SubscriptionStatus
-from schemas import UserRegister, UserLogin, Token, UserResponse, TokenRefresh
+from schemas import UserRegister, UserLogin, Token, UserResponse
 from auth import (
     get_password_hash,
     verify_password,
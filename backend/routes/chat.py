@@ -1,7 +1,7 @@
 """Chat routes for SEO Orchestrator interaction"""
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import select, delete
 from typing import List
 import logging
 import uuid
@@ -171,15 +171,10 @@ async def clear_chat_history(
             detail="Not authorized to access this audit"
         )
     
-    # Delete all messages for this audit
-    result = await db.execute(
-        select(ChatMessage).where(ChatMessage.audit_id == audit_id)
+    # Delete all messages for this audit in a single statement
+    await db.execute(
+        delete(ChatMessage).where(ChatMessage.audit_id == audit_id)
     )
-    messages = result.scalars().all()
-    
-    for message in messages:
-        await db.delete(message)
-    
     await db.commit()
     
     # Clear orchestrator
@@ -6,6 +6,7 @@ from typing import Literal
 import logging
 import uuid
 import os
+import orjson
 from datetime import datetime, timezone, timedelta
 
 from database import get_db
@@ -180,7 +181,9 @@ async def stripe_webhook(request: Request, db: AsyncSession = Depends(get_db)):
 @router.post("/razorpay-webhook")
 async def razorpay_webhook(request: Request, db: AsyncSession = Depends(get_db)):
     """Handle Razorpay webhook events"""
-    payload = await request.json()
+    # Read the body once and parse it with orjson
+    body = await request.body()
+    payload = orjson.loads(body)
     
     # Verify webhook signature
     webhook_secret = os.getenv('RAZORPAY_WEBHOOK_SECRET', '')
@@ -189,7 +192,7 @@ async def razorpay_webhook(request: Request, db: AsyncSession = Depends(get_db))
     if webhook_secret and signature:
         try:
             razorpay_client.utility.verify_webhook_signature(
-                await request.body(),
+                body.decode('utf-8'),
                 signature,
                 webhook_secret
             )
@@ -2,28 +2,50 @@
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
-from typing import List
+from typing import List, Optional, Tuple
 import logging
+import time
 import uuid
 
 from database import get_db
 from models import Plan, User
 from schemas import PlanResponse, PlanCreate, PlanUpdate
-from auth import get_current_user, get_current_superadmin
+from auth import get_current_superadmin
 
 router = APIRouter(prefix="/plans", tags=["Plans"])
 logger = logging.getLogger(__name__)
 
+# In-process cache for the public plan list: (fetched_at, plans)
+PLANS_CACHE_TTL = 300  # seconds
+_plans_cache: Optional[Tuple[float, List[PlanResponse]]] = None
+# Bumped on every invalidation so a query that raced a plan update is not cached
+_plans_cache_generation = 0
+
+
+def _invalidate_plans_cache():
+    """Drop the cached plan list after a plan is created or updated"""
+    global _plans_cache, _plans_cache_generation
+    _plans_cache = None
+    _plans_cache_generation += 1
+
 
 @router.get("/", response_model=List[PlanResponse])
 async def get_plans(db: AsyncSession = Depends(get_db)):
     """Get all active plans (public)"""
+    global _plans_cache
+    if _plans_cache and time.monotonic() - _plans_cache[0] < PLANS_CACHE_TTL:
+        return _plans_cache[1]
+    
+    generation = _plans_cache_generation
     result = await db.execute(
         select(Plan)
         .where(Plan.is_active == True)
         .order_by(Plan.price)
     )
-    plans = result.scalars().all()
+    plans = [PlanResponse.model_validate(plan) for plan in result.scalars().all()]
+    # Only cache if no plan changed while the query was awaited
+    if generation == _plans_cache_generation:
+        _plans_cache = (time.monotonic(), plans)
     return plans
 
 
@@ -58,6 +80,7 @@ async def create_plan(
     db.add(plan)
     await db.commit()
     await db.refresh(plan)
+    _invalidate_plans_cache()
     
     logger.info(f"Plan created: {plan.name}")
     return plan
@@ -87,6 +110,7 @@ async def update_plan(
     
     await db.commit()
     await db.refresh(plan)
+    _invalidate_plans_cache()
     
     logger.info(f"Plan updated: {plan.name}")
     return plan
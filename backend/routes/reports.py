@@ -4,13 +4,13 @@ from fastapi.responses import FileResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
 import logging
-import os
 from pathlib import Path
+from typing import Optional
 
 from database import get_db
 from models import User, Audit, AuditResult
 from auth import get_current_user
-from utils.report_generator import generate_pdf_report, generate_docx_report
+from utils.report_generator import generate_pdf_report, generate_docx_report, REPORT_VERSION
 
 router = APIRouter(prefix="/reports", tags=["Reports"])
 logger = logging.getLogger(__name__)
@@ -20,13 +20,8 @@ REPORTS_DIR = Path(__file__).parent.parent / "reports"
 REPORTS_DIR.mkdir(exist_ok=True)
 
 
-@router.get("/{audit_id}/pdf")
-async def download_pdf_report(
-    audit_id: str,
-    current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db)
-):
-    """Generate and download PDF report for an audit"""
+async def _get_completed_audit(audit_id: str, current_user: User, db: AsyncSession):
+    """Load a completed audit the user may access"""
     # Verify audit access
     result = await db.execute(
         select(Audit).where(Audit.id == audit_id)
@@ -51,21 +46,53 @@ async def download_pdf_report(
             detail="Audit not yet completed"
         )
     
-    # Get audit results
+    return audit
+
+
+async def _get_report_results(audit_id: str, db: AsyncSession):
+    """Load audit results in report order"""
     result = await db.execute(
         select(AuditResult)
         .where(AuditResult.audit_id == audit_id)
         .order_by(AuditResult.category, AuditResult.impact_score.desc())
     )
-    results = result.scalars().all()
+    return result.scalars().all()
+
+
+def _existing_report(path: Optional[str]) -> Optional[Path]:
+    """Return a previously generated report file if it is current and still on disk"""
+    if path and f"_v{REPORT_VERSION}_" in Path(path).name and Path(path).is_file():
+        return Path(path)
+    return None
+
+
+async def _get_or_build_report(audit: Audit, db: AsyncSession, attr: str, generator) -> Path:
+    """Reuse the audit's stored report, generating and saving it on first download"""
+    # Completed audits never change, so a report from the current generator
+    # version can be served again as-is
+    report_path = _existing_report(getattr(audit, attr))
+    if report_path is None:
+        results = await _get_report_results(audit.id, db)
+        report_path = await generator(audit, results, REPORTS_DIR)
+        
+        # Update audit with report path
+        setattr(audit, attr, str(report_path))
+        await db.commit()
+    return report_path
+
+
+@router.get("/{audit_id}/pdf")
+async def download_pdf_report(
+    audit_id: str,
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db)
+):
+    """Generate and download PDF report for an audit"""
+    audit = await _get_completed_audit(audit_id, current_user, db)
     
     # Generate PDF
     try:
-        pdf_path = await generate_pdf_report(audit, results, REPORTS_DIR)
-        
-        # Update audit with PDF path
-        audit.report_pdf_path = str(pdf_path)
-        await db.commit()
+        pdf_path = await _get_or_build_report(audit, db, "report_pdf_path", generate_pdf_report)
         
         # Return file for download
         filename = f"SEO_Audit_{audit.website_url.replace('https://', '').replace('http://', '').replace('/', '_')}_{audit_id[:8]}.pdf"
@@ -92,45 +119,11 @@ async def download_docx_report(
     db: AsyncSession = Depends(get_db)
 ):
     """Generate and download DOCX report for an audit"""
-    # Verify audit access
-    result = await db.execute(
-        select(Audit).where(Audit.id == audit_id)
-    )
-    audit = result.scalar_one_or_none()
-    
-    if not audit:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Audit not found"
-        )
-    
-    if audit.user_id != current_user.id and current_user.role != 'superadmin':
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Not authorized to access this audit"
-        )
-    
-    if audit.status != "completed":
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Audit not yet completed"
-        )
-    
-    # Get audit results
-    result = await db.execute(
-        select(AuditResult)
-        .where(AuditResult.audit_id == audit_id)
-        .order_by(AuditResult.category, AuditResult.impact_score.desc())
-    )
-    results = result.scalars().all()
+    audit = await _get_completed_audit(audit_id, current_user, db)
     
     # Generate DOCX
     try:
-        docx_path = await generate_docx_report(audit, results, REPORTS_DIR)
-        
-        # Update audit with DOCX path
-        audit.report_docx_path = str(docx_path)
-        await db.commit()
+        docx_path = await _get_or_build_report(audit, db, "report_docx_path", generate_docx_report)
         
         # Return file for download
         filename = f"SEO_Audit_{audit.website_url.replace('https://', '').replace('http://', '').replace('/', '_')}_{audit_id[:8]}.docx"
@@ -1,6 +1,6 @@
 """SEO Engine package"""
 from .crawler import crawl_website, CrawledPage
 from .comprehensive_checks import run_all_comprehensive_checks
-from .orchestrator import SEOOrchestrator
+from .orchestrator import SEOOrchestrator, close_shared_client
 
-__all__ = ['crawl_website', 'CrawledPage', 'run_all_comprehensive_checks', 'SEOOrchestrator']
+__all__ = ['crawl_website', 'CrawledPage', 'run_all_comprehensive_checks', 'SEOOrchestrator', 'close_shared_client']
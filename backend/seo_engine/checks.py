@@ -1,9 +1,6 @@
 """SEO Checks Implementation - 132 Comprehensive Checks"""
 from typing import List, Dict, Any
 from .crawler import CrawledPage
-import re
-from bs4 import BeautifulSoup
-from urllib.parse import urlparse
 import logging
 
 logger = logging.getLogger(__name__)
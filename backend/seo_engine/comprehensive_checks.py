@@ -8,7 +8,6 @@ import logging
 
 logger = logging.getLogger(__name__)
 
-
 class TechnicalSEOChecks:
     """Technical SEO checks - 28 total checks"""
     
@@ -1792,7 +1791,7 @@ class OnPageSEOChecks:
     
     @staticmethod
     def check_table_of_contents(pages: List[CrawledPage]) -> Dict[str, Any]:
-        has_toc = sum(1 for p in pages if 'table-of-contents' in p.html.lower() or 'toc' in p.html.lower())
+        has_toc = sum(1 for p in pages if 'table-of-contents' in p.html_lower or 'toc' in p.html_lower)
         percentage = (has_toc / len(pages) * 100) if pages else 0
         status = "pass" if percentage > 30 else "info"
         return {
@@ -1816,7 +1815,7 @@ class OnPageSEOChecks:
     
     @staticmethod
     def check_author_info(pages: List[CrawledPage]) -> Dict[str, Any]:
-        has_author = sum(1 for p in pages if 'author' in p.html.lower() or 'byline' in p.html.lower())
+        has_author = sum(1 for p in pages if 'author' in p.html_lower or 'byline' in p.html_lower)
         percentage = (has_author / len(pages) * 100) if pages else 0
         status = "pass" if percentage > 50 else ("warning" if percentage > 20 else "info")
         return {
@@ -1840,7 +1839,7 @@ class OnPageSEOChecks:
     
     @staticmethod
     def check_publish_date(pages: List[CrawledPage]) -> Dict[str, Any]:
-        has_date = sum(1 for p in pages if 'published' in p.html.lower() or 'date' in p.html.lower() or 'time' in p.html.lower())
+        has_date = sum(1 for p in pages if 'published' in p.html_lower or 'date' in p.html_lower or 'time' in p.html_lower)
         percentage = (has_date / len(pages) * 100) if pages else 0
         status = "pass" if percentage > 60 else ("warning" if percentage > 30 else "fail")
         return {
@@ -1864,7 +1863,7 @@ class OnPageSEOChecks:
     
     @staticmethod
     def check_related_content(pages: List[CrawledPage]) -> Dict[str, Any]:
-        has_related = sum(1 for p in pages if 'related' in p.html.lower() or 'similar' in p.html.lower() or 'recommended' in p.html.lower())
+        has_related = sum(1 for p in pages if 'related' in p.html_lower or 'similar' in p.html_lower or 'recommended' in p.html_lower)
         percentage = (has_related / len(pages) * 100) if pages else 0
         status = "pass" if percentage > 50 else ("warning" if percentage > 20 else "info")
         return {
@@ -2199,7 +2198,7 @@ class SocialMediaChecks:
         
         for page in pages:
             # Check for common share button patterns
-            if 'share' in page.html.lower() or 'social' in page.html.lower():
+            if 'share' in page.html_lower or 'social' in page.html_lower:
                 pages_with_sharing += 1
         
         percentage = (pages_with_sharing / len(pages) * 100) if pages else 0
@@ -2267,7 +2266,7 @@ class SocialMediaChecks:
     
     @staticmethod
     def check_social_proof(pages: List[CrawledPage]) -> Dict[str, Any]:
-        has_proof = sum(1 for p in pages if 'testimonial' in p.html.lower() or 'review' in p.html.lower() or 'rating' in p.html.lower())
+        has_proof = sum(1 for p in pages if 'testimonial' in p.html_lower or 'review' in p.html_lower or 'rating' in p.html_lower)
         percentage = (has_proof / len(pages) * 100) if pages else 0
         status = "pass" if percentage > 30 else "info"
         return {
@@ -2729,8 +2728,7 @@ class GEOAEOChecks:
         question_words = ['what', 'who', 'where', 'when', 'why', 'how']
         optimized_count = 0
         for page in pages:
-            text = page.html.lower()
-            if any(word in text for word in question_words):
+            if any(word in page.html_lower for word in question_words):
                 optimized_count += 1
         percentage = (optimized_count / len(pages) * 100) if pages else 0
         status = "pass" if percentage > 60 else ("warning" if percentage > 30 else "fail")
@@ -3008,7 +3006,7 @@ class AdvancedChecks:
     
     @staticmethod
     def check_cookie_consent(pages: List[CrawledPage]) -> Dict[str, Any]:
-        has_consent = sum(1 for p in pages if 'cookie' in p.html.lower() and ('consent' in p.html.lower() or 'accept' in p.html.lower()))
+        has_consent = sum(1 for p in pages if 'cookie' in p.html_lower and ('consent' in p.html_lower or 'accept' in p.html_lower))
         percentage = (has_consent / len(pages) * 100) if pages else 0
         status = "warning" if percentage < 50 else "pass"
         return {
@@ -1,6 +1,7 @@
 """Website crawler for SEO audits"""
 import asyncio
 import aiohttp
+from collections import deque
 from bs4 import BeautifulSoup
 from urllib.parse import urljoin, urlparse
 from typing import List, Dict, Set, Optional
@@ -11,9 +12,9 @@ import time
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class CrawledPage:
-    """Data structure for a crawled page"""
+    """Data structure for a crawled page (slotted: one instance per crawled URL)"""
     url: str
     html: str
     status_code: int
@@ -31,8 +32,11 @@ class CrawledPage:
     has_viewport: bool = False
     has_https: bool = False
     word_count: int = 0
+    html_lower: Optional[str] = None  # lowercased once for the keyword checks
     
     def __post_init__(self):
+        if self.html_lower is None:
+            self.html_lower = self.html.lower()
         if self.h1_tags is None:
             self.h1_tags = []
         if self.h2_tags is None:
@@ -50,17 +54,24 @@ class CrawledPage:
 class WebsiteCrawler:
     """Crawls a website and extracts SEO-relevant data"""
     
-    def __init__(self, max_pages: int = 20, timeout: int = 30):
+    # Pages in a batch are fetched from the same host at once, so each page's
+    # load_time includes some server-side and event-loop contention and runs
+    # a little above a sequential fetch. That number feeds the scored
+    # Performance checks, so keep batches small (3) rather than maximising
+    # throughput; use concurrency=1 for timings comparable to a serial crawl.
+    def __init__(self, max_pages: int = 20, timeout: int = 30, max_connections: int = 10, concurrency: int = 3):
         self.max_pages = max_pages
         self.timeout = timeout
+        self.max_connections = max_connections
+        self.concurrency = concurrency
         self.visited_urls: Set[str] = set()
         self.crawled_pages: List[CrawledPage] = []
         self.base_domain = ""
+        self.allowed_domains: Set[str] = set()
     
     def _is_same_domain(self, url: str) -> bool:
         """Check if URL belongs to the same domain"""
-        parsed = urlparse(url)
-        return parsed.netloc == self.base_domain or parsed.netloc == f"www.{self.base_domain}" or parsed.netloc == self.base_domain.replace("www.", "")
+        return urlparse(url).netloc in self.allowed_domains
     
     def _normalize_url(self, url: str) -> str:
         """Normalize URL by removing fragments and trailing slashes"""
@@ -72,88 +83,94 @@ class WebsiteCrawler:
             normalized = normalized[:-1]
         return normalized
     
+    def _parse_page(self, url: str, html: str, status_code: int, load_time: float) -> CrawledPage:
+        """Parse fetched HTML into a CrawledPage (CPU-bound, runs in a worker thread)"""
+        soup = BeautifulSoup(html, 'lxml')
+        
+        # Extract metadata
+        title_tag = soup.find('title')
+        title = title_tag.string.strip() if title_tag and title_tag.string else None
+        
+        meta_desc = soup.find('meta', attrs={'name': 'description'})
+        meta_description = meta_desc.get('content', '').strip() if meta_desc else None
+        
+        meta_robots = soup.find('meta', attrs={'name': 'robots'})
+        robots_content = meta_robots.get('content', '') if meta_robots else None
+        
+        canonical_tag = soup.find('link', attrs={'rel': 'canonical'})
+        canonical = canonical_tag.get('href', '') if canonical_tag else None
+        
+        # Extract headings
+        h1_tags = [h1.get_text(strip=True) for h1 in soup.find_all('h1')]
+        h2_tags = [h2.get_text(strip=True) for h2 in soup.find_all('h2')]
+        
+        # Extract images
+        images = []
+        for img in soup.find_all('img'):
+            images.append({
+                'src': img.get('src', ''),
+                'alt': img.get('alt', ''),
+                'title': img.get('title', '')
+            })
+        
+        # Extract links
+        links = []
+        for a in soup.find_all('a', href=True):
+            href = a['href']
+            absolute_url = urljoin(url, href)
+            if absolute_url.startswith('http'):
+                links.append(absolute_url)
+        
+        # Extract scripts and stylesheets
+        scripts = [script.get('src', '') for script in soup.find_all('script', src=True)]
+        stylesheets = [link.get('href', '') for link in soup.find_all('link', rel='stylesheet')]
+        
+        # Check viewport
+        viewport = soup.find('meta', attrs={'name': 'viewport'})
+        has_viewport = viewport is not None
+        
+        # Check HTTPS
+        has_https = url.startswith('https://')
+        
+        # Word count
+        text = soup.get_text()
+        word_count = len(text.split())
+        
+        return CrawledPage(
+            url=url,
+            html=html,
+            status_code=status_code,
+            title=title,
+            meta_description=meta_description,
+            meta_robots=robots_content,
+            canonical=canonical,
+            h1_tags=h1_tags,
+            h2_tags=h2_tags,
+            images=images,
+            links=links,
+            scripts=scripts,
+            stylesheets=stylesheets,
+            load_time=load_time,
+            has_viewport=has_viewport,
+            has_https=has_https,
+            word_count=word_count
+        )
+    
     async def _fetch_page(self, session: aiohttp.ClientSession, url: str) -> Optional[CrawledPage]:
         """Fetch and parse a single page"""
         try:
-            start_time = time.time()
+            # Time only this page's request/response; parsing happens afterwards
+            start_time = time.perf_counter()
             async with session.get(url, timeout=aiohttp.ClientTimeout(total=self.timeout), allow_redirects=True) as response:
                 html = await response.text()
-                load_time = time.time() - start_time
-                
-                # Parse HTML
-                soup = BeautifulSoup(html, 'lxml')
-                
-                # Extract metadata
-                title_tag = soup.find('title')
-                title = title_tag.string.strip() if title_tag and title_tag.string else None
-                
-                meta_desc = soup.find('meta', attrs={'name': 'description'})
-                meta_description = meta_desc.get('content', '').strip() if meta_desc else None
-                
-                meta_robots = soup.find('meta', attrs={'name': 'robots'})
-                robots_content = meta_robots.get('content', '') if meta_robots else None
-                
-                canonical_tag = soup.find('link', attrs={'rel': 'canonical'})
-                canonical = canonical_tag.get('href', '') if canonical_tag else None
-                
-                # Extract headings
-                h1_tags = [h1.get_text(strip=True) for h1 in soup.find_all('h1')]
-                h2_tags = [h2.get_text(strip=True) for h2 in soup.find_all('h2')]
-                
-                # Extract images
-                images = []
-                for img in soup.find_all('img'):
-                    images.append({
-                        'src': img.get('src', ''),
-                        'alt': img.get('alt', ''),
-                        'title': img.get('title', '')
-                    })
-                
-                # Extract links
-                links = []
-                for a in soup.find_all('a', href=True):
-                    href = a['href']
-                    absolute_url = urljoin(url, href)
-                    if absolute_url.startswith('http'):
-                        links.append(absolute_url)
-                
-                # Extract scripts and stylesheets
-                scripts = [script.get('src', '') for script in soup.find_all('script', src=True)]
-                stylesheets = [link.get('href', '') for link in soup.find_all('link', rel='stylesheet')]
-                
-                # Check viewport
-                viewport = soup.find('meta', attrs={'name': 'viewport'})
-                has_viewport = viewport is not None
-                
-                # Check HTTPS
-                has_https = url.startswith('https://')
-                
-                # Word count
-                text = soup.get_text()
-                word_count = len(text.split())
-                
-                crawled_page = CrawledPage(
-                    url=url,
-                    html=html,
-                    status_code=response.status,
-                    title=title,
-                    meta_description=meta_description,
-                    meta_robots=robots_content,
-                    canonical=canonical,
-                    h1_tags=h1_tags,
-                    h2_tags=h2_tags,
-                    images=images,
-                    links=links,
-                    scripts=scripts,
-                    stylesheets=stylesheets,
-                    load_time=load_time,
-                    has_viewport=has_viewport,
-                    has_https=has_https,
-                    word_count=word_count
-                )
-                
-                logger.info(f"Successfully crawled: {url} (Status: {response.status}, Load time: {load_time:.2f}s)")
-                return crawled_page
+                load_time = time.perf_counter() - start_time
+                status_code = response.status
+            
+            # Parse off the event loop so other requests keep being served
+            crawled_page = await asyncio.to_thread(self._parse_page, url, html, status_code, load_time)
+            
+            logger.info(f"Successfully crawled: {url} (Status: {status_code}, Load time: {load_time:.2f}s)")
+            return crawled_page
                 
         except asyncio.TimeoutError:
             logger.error(f"Timeout crawling {url}")
@@ -170,29 +187,55 @@ class WebsiteCrawler:
         # Parse base domain
         parsed = urlparse(start_url)
         self.base_domain = parsed.netloc
+        # Build the accepted host variants once instead of per discovered link
+        self.allowed_domains = {
+            self.base_domain,
+            f"www.{self.base_domain}",
+            self.base_domain.replace("www.", "")
+        }
         
         # Initialize
-        urls_to_visit = [start_url]
+        urls_to_visit = deque([start_url])
+        queued_urls = {self._normalize_url(start_url)}  # O(1) membership for the frontier
         self.visited_urls = set()
         self.crawled_pages = []
         
-        async with aiohttp.ClientSession() as session:
+        # Keep-alive pool sized for a single host; DNS is resolved once per crawl
+        connector = aiohttp.TCPConnector(
+            limit=self.max_connections,
+            limit_per_host=self.max_connections,
+            ttl_dns_cache=300,
+            keepalive_timeout=30
+        )
+        
+        async with aiohttp.ClientSession(connector=connector) as session:
             while urls_to_visit and len(self.crawled_pages) < self.max_pages:
-                # Get next URL
-                current_url = urls_to_visit.pop(0)
-                normalized_url = self._normalize_url(current_url)
-                
-                # Skip if already visited
-                if normalized_url in self.visited_urls:
-                    continue
+                # Take the next batch of unvisited URLs, never more than the pages still allowed
+                batch_size = min(self.concurrency, self.max_pages - len(self.crawled_pages))
+                batch = []
+                while urls_to_visit and len(batch) < batch_size:
+                    normalized_url = self._normalize_url(urls_to_visit.popleft())
+                    
+                    # Skip if already visited
+                    if normalized_url in self.visited_urls:
+                        continue
+                    
+                    # Mark as visited
+                    self.visited_urls.add(normalized_url)
+                    batch.append(normalized_url)
                 
-                # Mark as visited
-                self.visited_urls.add(normalized_url)
+                if not batch:
+                    break
                 
-                # Crawl the page
-                crawled_page = await self._fetch_page(session, normalized_url)
+                # Crawl the batch concurrently, keeping discovery order
+                crawled_batch = await asyncio.gather(
+                    *(self._fetch_page(session, url) for url in batch)
+                )
                 
-                if crawled_page:
+                for crawled_page in crawled_batch:
+                    if not crawled_page:
+                        continue
+                    
                     self.crawled_pages.append(crawled_page)
                     
                     # Add new URLs to visit (only from same domain)
@@ -200,10 +243,11 @@ class WebsiteCrawler:
                         normalized_link = self._normalize_url(link)
                         if (self._is_same_domain(normalized_link) and 
                             normalized_link not in self.visited_urls and 
-                            normalized_link not in urls_to_visit):
+                            normalized_link not in queued_urls):
                             urls_to_visit.append(normalized_link)
+                            queued_urls.add(normalized_link)
                 
-                # Small delay to be polite
+                # Small delay between batches to be polite
                 await asyncio.sleep(0.5)
         
         logger.info(f"Crawling completed. Total pages crawled: {len(self.crawled_pages)}")
@@ -2,11 +2,11 @@
 import os
 from typing import List, Dict, Any, Optional
 import logging
-from groq import Groq
-import json
-import asyncio
-from functools import wraps
-import time
+from collections import Counter
+from functools import lru_cache
+from itertools import islice
+from groq import AsyncGroq
+import httpx
 
 logger = logging.getLogger(__name__)
 
@@ -15,30 +15,34 @@ GROQ_API_KEY = os.getenv("GROQ_API_KEY", "gsk_3nKWHz1bxuYT9PotZQdPWGdyb3FYabviC4
 EXA_API_KEY = os.getenv("EXA_API_KEY", "28a8cf69-fb6d-45db-8c2a-7f832d29aec3")
 
 
-def retry_on_failure(max_retries=3, delay=1):
-    """Decorator for retry logic (Parlant.io-style reliability)"""
-    def decorator(func):
-        @wraps(func)
-        async def wrapper(*args, **kwargs):
-            for attempt in range(max_retries):
-                try:
-                    return await func(*args, **kwargs)
-                except Exception as e:
-                    if attempt == max_retries - 1:
-                        logger.error(f"Failed after {max_retries} attempts: {str(e)}")
-                        raise
-                    logger.warning(f"Attempt {attempt + 1} failed: {str(e)}. Retrying...")
-                    await asyncio.sleep(delay * (attempt + 1))
-            return None
-        return wrapper
-    return decorator
+@lru_cache(maxsize=1)
+def _shared_client() -> AsyncGroq:
+    """Process-wide Groq client so every orchestrator reuses one connection pool"""
+    return AsyncGroq(
+        api_key=GROQ_API_KEY,
+        # Connection errors, 429s and 5xx are retried with exponential backoff by the client
+        max_retries=3,
+        # HTTP/2 multiplexes concurrent completions over one TLS connection
+        http_client=httpx.AsyncClient(
+            http2=True,
+            timeout=httpx.Timeout(60.0, connect=10.0),
+            limits=httpx.Limits(max_connections=50, max_keepalive_connections=20)
+        )
+    )
+
+
+async def close_shared_client():
+    """Close the shared client's connection pool on shutdown (no-op if never created)"""
+    if _shared_client.cache_info().currsize:
+        await _shared_client().close()
+        _shared_client.cache_clear()
 
 
 class SEOOrchestrator:
     """Orchestrator agent for SEO analysis and recommendations"""
     
     def __init__(self):
-        self.client = Groq(api_key=GROQ_API_KEY)
+        self.client = _shared_client()
         self.model = "llama-3.3-70b-versatile"  # Fast, capable model
         self.conversation_history: List[Dict[str, str]] = []
         self.max_context_length = 8000  # tokens
@@ -68,24 +72,22 @@ class SEOOrchestrator:
         
         return self.conversation_history
     
-    @retry_on_failure(max_retries=3, delay=2)
     async def analyze_audit_results(self, audit_results: List[Dict[str, Any]]) -> str:
         """Analyze audit results and provide comprehensive insights"""
-        # Prepare summary of results
-        failed_checks = [r for r in audit_results if r.get('status') == 'fail']
-        warning_checks = [r for r in audit_results if r.get('status') == 'warning']
-        passed_checks = [r for r in audit_results if r.get('status') == 'pass']
+        # Prepare summary of results (one counting pass, no per-status lists)
+        status_counts = Counter(r.get('status') for r in audit_results)
+        failed_checks = (r for r in audit_results if r.get('status') == 'fail')
         
         summary = f"""
 SEO Audit Results Summary:
 - Total Checks: {len(audit_results)}
-- Failed: {len(failed_checks)}
-- Warnings: {len(warning_checks)}
-- Passed: {len(passed_checks)}
+- Failed: {status_counts['fail']}
+- Warnings: {status_counts['warning']}
+- Passed: {status_counts['pass']}
 
 Top Issues:
 """
-        for check in failed_checks[:5]:
+        for check in islice(failed_checks, 5):
             summary += f"\n- {check.get('check_name')}: {check.get('cons', [])[0] if check.get('cons') else 'Issue detected'}"
         
         prompt = f"""
@@ -104,8 +106,7 @@ Be specific, actionable, and prioritize by impact.
 """
         
         try:
-            response = await asyncio.to_thread(
-                self.client.chat.completions.create,
+            response = await self.client.chat.completions.create(
                 model=self.model,
                 messages=[
                     {"role": "system", "content": "You are an expert SEO consultant providing actionable insights."},
@@ -123,7 +124,6 @@ Be specific, actionable, and prioritize by impact.
             logger.error(f"Error in AI analysis: {str(e)}")
             return "Unable to generate AI analysis. Please review the detailed check results."
     
-    @retry_on_failure(max_retries=3, delay=2)
     async def chat(self, user_message: str, audit_context: Optional[Dict[str, Any]] = None) -> str:
         """Interactive chat about SEO audit results"""
         # Build context-aware prompt
@@ -149,8 +149,7 @@ Current Audit Context:
         full_messages = [{"role": "system", "content": system_prompt}] + messages
         
         try:
-            response = await asyncio.to_thread(
-                self.client.chat.completions.create,
+            response = await self.client.chat.completions.create(
                 model=self.model,
                 messages=full_messages,
                 temperature=0.8,
@@ -188,8 +187,7 @@ Be detailed and actionable.
 """
         
         try:
-            response = await asyncio.to_thread(
-                self.client.chat.completions.create,
+            response = await self.client.chat.completions.create(
                 model=self.model,
                 messages=[
                     {"role": "system", "content": "You are an SEO research expert providing up-to-date, comprehensive information."},
@@ -1,6 +1,8 @@
 """MJ SEO - FastAPI Backend Server"""
 from fastapi import FastAPI, APIRouter
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse
 from dotenv import load_dotenv
 import os
 import logging
@@ -13,6 +15,7 @@ load_dotenv(ROOT_DIR / '.env')
 
 # Import routes
 from routes import auth, audits, plans, admin, chat, api_tokens, reports, payments
+from seo_engine import close_shared_client
 
 # Configure logging
 logging.basicConfig(
@@ -32,6 +35,7 @@ async def lifespan(app: FastAPI):
     yield
     # Shutdown
     logger.info("Shutting down MJ SEO Backend...")
+    await close_shared_client()
 
 
 # Create FastAPI app
@@ -39,7 +43,8 @@ app = FastAPI(
     title="MJ SEO API",
     description="Production-ready SEO Audit Platform with AI-powered insights",
     version="1.0.0",
-    lifespan=lifespan
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse
 )
 
 # Create API router with /api prefix
@@ -84,8 +89,24 @@ app.add_middleware(
     allow_origins=os.environ.get('CORS_ORIGINS', '*').split(','),
     allow_methods=["*"],
     allow_headers=["*"],
+    max_age=int(os.environ.get('CORS_MAX_AGE', '86400')),
 )
 
+class APIGZipMiddleware(GZipMiddleware):
+    """GZip for API JSON only - report downloads are streamed untouched"""
+    
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "http" and scope["path"].startswith("/api/reports/"):
+            # PDF/DOCX are already compressed; gzipping them just burns CPU
+            # and drops Content-Length from the FileResponse
+            await self.app(scope, receive, send)
+            return
+        await super().__call__(scope, receive, send)
+
+
+# Compress larger payloads (audit details carry every check result)
+app.add_middleware(APIGZipMiddleware, minimum_size=1000, compresslevel=5)
+
 
 if __name__ == "__main__":
     import uvicorn
@@ -1,18 +1,24 @@
 """Report generation utilities for PDF and DOCX formats"""
-from reportlab.lib.pagesizes import letter, A4
+from reportlab.lib.pagesizes import letter
 from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
 from reportlab.lib.units import inch
 from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle, PageBreak
 from reportlab.lib import colors
-from reportlab.lib.enums import TA_CENTER, TA_LEFT, TA_JUSTIFY
+from reportlab.lib.enums import TA_CENTER
 from docx import Document
-from docx.shared import Inches, Pt, RGBColor
+from docx.shared import Pt, RGBColor
 from docx.enum.text import WD_ALIGN_PARAGRAPH
 from typing import List
 from pathlib import Path
 import asyncio
 from datetime import datetime
 
+# Bump whenever report content or layout changes: stored reports from older
+# versions are then regenerated on the next download instead of being reused.
+# Old files in reports/ are not deleted; remove them by hand (or with a cron
+# job) once no audit points at them any more.
+REPORT_VERSION = 1
+
 
 async def generate_pdf_report(audit, results: List, reports_dir: Path) -> Path:
     """Generate a comprehensive PDF report"""
@@ -20,7 +26,7 @@ async def generate_pdf_report(audit, results: List, reports_dir: Path) -> Path:
     def _generate():
         # Create filename
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        filename = f"audit_{audit.id}_{timestamp}.pdf"
+        filename = f"audit_{audit.id}_v{REPORT_VERSION}_{timestamp}.pdf"
         filepath = reports_dir / filename
         
         # Create PDF
@@ -176,7 +182,7 @@ async def generate_docx_report(audit, results: List, reports_dir: Path) -> Path:
     def _generate():
         # Create filename
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        filename = f"audit_{audit.id}_{timestamp}.docx"
+        filename = f"audit_{audit.id}_v{REPORT_VERSION}_{timestamp}.docx"
         filepath = reports_dir / filename
         
         # Create DOCX
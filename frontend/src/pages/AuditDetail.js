@@ -35,10 +35,40 @@ const AuditDetail = () => {
   useEffect(() => {
     if (audit && ['pending', 'crawling', 'analyzing', 'generating_report'].includes(audit.status)) {
       setPolling(true);
-      const interval = setInterval(() => {
-        fetchAudit();
-      }, 3000);
-      return () => clearInterval(interval);
+      // Long-poll the server until the status changes, then load full details.
+      // Errors (on either request) back off exponentially (1s -> 8s) and retry.
+      const controller = new AbortController();
+      let cancelled = false;
+      const waitForChange = async () => {
+        let delay = 1000;
+        let changed = false;
+        while (!cancelled) {
+          try {
+            if (!changed) {
+              const response = await api.get(`/audits/${id}/wait`, {
+                params: { status: audit.status, timeout: 25 },
+                signal: controller.signal
+              });
+              delay = 1000;
+              changed = response.data.status !== audit.status;
+              if (!changed) continue;
+            }
+            const response = await api.get(`/audits/${id}`, { signal: controller.signal });
+            if (!cancelled) setAudit(response.data);
+            return;
+          } catch (error) {
+            if (cancelled) return;
+            console.error('Error waiting for audit:', error);
+            await new Promise((resolve) => setTimeout(resolve, delay));
+            delay = Math.min(delay * 2, 8000);
+          }
+        }
+      };
+      waitForChange();
+      return () => {
+        cancelled = true;
+        controller.abort();
+      };
     } else {
       setPolling(false);
     }
@@ -35,6 +35,17 @@ const Dashboard = () => {
     }
   };
 
+  const refreshAudit = async (auditId, status) => {
+    try {
+      const response = await api.get(`/audits/${auditId}/wait`, {
+        params: { status, timeout: 10 }
+      });
+      setAudits((current) => current.map((audit) => (audit.id === auditId ? response.data : audit)));
+    } catch (error) {
+      console.error('Error refreshing audit:', error);
+    }
+  };
+
   const createAudit = async (e) => {
     e.preventDefault();
     setError('');
@@ -42,10 +53,11 @@ const Dashboard = () => {
 
     try {
       const response = await api.post('/audits/', { website_url: websiteUrl });
-      setAudits([response.data, ...audits]);
+      const created = response.data;
+      setAudits((current) => [created, ...current]);
       setWebsiteUrl('');
-      // Poll for updates
-      setTimeout(() => fetchAudits(), 2000);
+      // Refresh just the new audit once it leaves its initial status
+      refreshAudit(created.id, created.status);
     } catch (err) {
       setError(err.response?.data?.detail || 'Failed to create audit');
     } finally {
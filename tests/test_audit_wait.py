@@ -0,0 +1,173 @@
+"""Tests for the audit long-poll endpoint (GET /api/audits/{id}/wait)"""
+import os
+import sys
+import tempfile
+import threading
+import time
+import uuid
+from pathlib import Path
+
+import pytest
+
+# The backend reads DATABASE_URL at import time, so point it at a scratch DB first
+DB_PATH = Path(tempfile.mkdtemp()) / "test_audit_wait.db"
+os.environ["DATABASE_URL"] = f"sqlite+aiosqlite:///{DB_PATH}"
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "backend"))
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+
+from auth import create_access_token
+from database import Base
+from models import User, Audit, AuditStatus, UserRole
+from routes import audits
+
+# Separate sync engine: lets tests commit from "another session", as the background task does
+sync_engine = create_engine(f"sqlite:///{DB_PATH}")
+
+
+@pytest.fixture(autouse=True)
+def reset_db():
+    Base.metadata.drop_all(sync_engine)
+    Base.metadata.create_all(sync_engine)
+    yield
+
+
+@pytest.fixture
+def client():
+    app = FastAPI()
+    app.include_router(audits.router, prefix="/api")
+    with TestClient(app) as client:
+        yield client
+
+
+def _create_user(role=UserRole.USER) -> str:
+    user_id = str(uuid.uuid4())
+    with Session(sync_engine) as session:
+        session.add(User(
+            id=user_id,
+            email=f"{user_id}@example.com",
+            password_hash="x",
+            role=role,
+            is_active=True
+        ))
+        session.commit()
+    return user_id
+
+
+def _create_audit(user_id: str, audit_status: AuditStatus) -> str:
+    audit_id = str(uuid.uuid4())
+    with Session(sync_engine) as session:
+        session.add(Audit(
+            id=audit_id,
+            user_id=user_id,
+            website_url="https://example.com",
+            status=audit_status
+        ))
+        session.commit()
+    return audit_id
+
+
+def _set_status(audit_id: str, audit_status: AuditStatus):
+    with Session(sync_engine) as session:
+        session.get(Audit, audit_id).status = audit_status
+        session.commit()
+
+
+def _headers(user_id: str) -> dict:
+    return {"Authorization": f"Bearer {create_access_token({'sub': user_id})}"}
+
+
+def test_finished_audit_returns_immediately(client):
+    user_id = _create_user()
+    audit_id = _create_audit(user_id, AuditStatus.COMPLETED)
+
+    started = time.monotonic()
+    response = client.get(
+        f"/api/audits/{audit_id}/wait",
+        params={"status": "completed", "timeout": 10},
+        headers=_headers(user_id)
+    )
+
+    assert response.status_code == 200
+    assert response.json()["status"] == "completed"
+    assert time.monotonic() - started < 2
+
+
+def test_times_out_with_unchanged_status(client):
+    user_id = _create_user()
+    audit_id = _create_audit(user_id, AuditStatus.CRAWLING)
+
+    started = time.monotonic()
+    response = client.get(
+        f"/api/audits/{audit_id}/wait",
+        params={"status": "crawling", "timeout": 1},
+        headers=_headers(user_id)
+    )
+    elapsed = time.monotonic() - started
+
+    assert response.status_code == 200
+    assert response.json()["status"] == "crawling"
+    assert 1 <= elapsed < 5
+
+
+def test_sees_status_committed_by_another_session(client):
+    user_id = _create_user()
+    audit_id = _create_audit(user_id, AuditStatus.CRAWLING)
+
+    def advance():
+        time.sleep(1.5)
+        _set_status(audit_id, AuditStatus.ANALYZING)
+
+    writer = threading.Thread(target=advance)
+    writer.start()
+    started = time.monotonic()
+    response = client.get(
+        f"/api/audits/{audit_id}/wait",
+        params={"status": "crawling", "timeout": 20},
+        headers=_headers(user_id)
+    )
+    elapsed = time.monotonic() - started
+    writer.join()
+
+    assert response.status_code == 200
+    assert response.json()["status"] == "analyzing"
+    assert elapsed < 10
+
+
+def test_other_users_audit_is_forbidden(client):
+    owner_id = _create_user()
+    other_id = _create_user()
+    audit_id = _create_audit(owner_id, AuditStatus.CRAWLING)
+
+    response = client.get(
+        f"/api/audits/{audit_id}/wait",
+        params={"timeout": 1},
+        headers=_headers(other_id)
+    )
+
+    assert response.status_code == 403
+
+
+def test_superadmin_can_wait_on_any_audit(client):
+    owner_id = _create_user()
+    admin_id = _create_user(role=UserRole.SUPERADMIN)
+    audit_id = _create_audit(owner_id, AuditStatus.COMPLETED)
+
+    response = client.get(f"/api/audits/{audit_id}/wait", headers=_headers(admin_id))
+
+    assert response.status_code == 200
+
+
+def test_unknown_audit_is_not_found(client):
+    user_id = _create_user()
+
+    response = client.get(
+        f"/api/audits/{uuid.uuid4()}/wait",
+        params={"timeout": 1},
+        headers=_headers(user_id)
+    )
+
+    assert response.status_code == 404